@@ -81,22 +81,42 @@ class HookDispatcher(collections.abc.Mapping):
         if self._event_dispatcher is not None:
             self._event_dispatcher.notify(name, *args, **kwargs)
 
-        if self._callbacks[name]:
-            return self._callbacks[name](*args, **kwargs)
+        callback = self._callbacks[name]
+
+        if callback:
+            return callback(*args, **kwargs)
         else:
             raise HookDisconnected('No callback is connected.')
 
-    
+
     async def call_async(self, name: str, *args, **kwargs):
         '''Invoke the callback.'''
         if self._event_dispatcher is not None:
             self._event_dispatcher.notify(name, *args, **kwargs)
 
-        if self._callbacks[name]:
-            return (await self._callbacks[name](*args, **kwargs))
+        callback = self._callbacks[name]
+
+        if callback:
+            return (await callback(*args, **kwargs))
         else:
             raise HookDisconnected('No callback is connected.')
 
+    def call_default(self, name: str, default, *args, **kwargs):
+        '''Invoke the callback or return `default` if not connected.
+
+        Unlike :meth:`call`, no error is raised when no callback is
+        connected. Event listeners are notified either way.
+        '''
+        if self._event_dispatcher is not None:
+            self._event_dispatcher.notify(name, *args, **kwargs)
+
+        callback = self._callbacks[name]
+
+        if callback:
+            return callback(*args, **kwargs)
+        else:
+            return default
+
     def is_connected(self, name: str) -> bool:
         '''Return whether the hook is connected.'''
         return bool(self._callbacks[name])
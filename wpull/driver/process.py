@@ -97,7 +97,7 @@ class Process:
             while self._process.returncode is None:
                 line = await self._process.stdout.readline()
 
-                _logger.debug('Read stdout line %s', repr(line))
+                _logger.debug('Read stdout line %r', line)
 
                 if not line:
                     break
@@ -230,9 +230,6 @@ class BaseConnection:
     
     async def write(self, data: bytes, drain: bool=True):
         '''Write data.'''
-        assert self._state == ConnectionState.created, \
-            'Expect conn created. Got {}.'.format(self._state)
-
         self.writer.write(data)
 
         if drain:
@@ -245,9 +242,6 @@ class BaseConnection:
     
     async def read(self, amount: int=-1) -> bytes:
         '''Read data.'''
-        assert self._state == ConnectionState.created, \
-            'Expect conn created. Got {}.'.format(self._state)
-
         data = await \
             self.run_network_operation(
                 self.reader.read(amount),
@@ -259,9 +253,6 @@ class BaseConnection:
     
     async def readline(self) -> bytes:
         '''Read a line of data.'''
-        assert self._state == ConnectionState.created, \
-            'Expect conn created. Got {}.'.format(self._state)
-
         with self._close_timer.with_timeout():
             data = await \
                 self.run_network_operation(
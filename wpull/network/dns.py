@@ -22,7 +22,7 @@ from wpull.application.plugin import PluginFunctions, hook_interface, \
 from wpull.backport.logging import BraceMessage as __
 from wpull.cache import FIFOCache
 from wpull.errors import DNSNotFound, NetworkError
-from wpull.application.hook import HookableMixin, HookDisconnected
+from wpull.application.hook import HookableMixin
 import wpull.util
 import wpull.application.hook
 
@@ -172,11 +172,8 @@ class Resolver(HookableMixin):
 
         _logger.debug(__('Lookup address {0}.', host))
 
-        try:
-            host = self.hook_dispatcher.call(PluginFunctions.resolve_dns, host
-                                             ) or host
-        except HookDisconnected:
-            pass
+        host = self.hook_dispatcher.call_default(
+            PluginFunctions.resolve_dns, None, host) or host
 
         cache_key = (host, self._family)
 
@@ -129,10 +129,23 @@ class URLRecord(URLProperties, URLData, URLResult):
     '''
     def __init__(self):
         super().__init__()
-        self.url = None
+        self._url = None
+        self._url_info = None
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @url.setter
+    def url(self, url: str):
+        self._url = url
+        self._url_info = None
 
     @property
     def url_info(self) -> URLInfo:
         '''Return URL Info for this URL'''
-        return URLInfo.parse(self.url)
+        if self._url_info is None:
+            self._url_info = URLInfo.parse(self._url)
+
+        return self._url_info
 
@@ -13,7 +13,7 @@ from wpull.url import URLInfo
 from wpull.backport.logging import StyleAdapter
 from wpull.errors import DNSNotFound, ServerError, ConnectionRefused, \
     SSLCertVerificationError, ProtocolError
-from wpull.application.hook import HookableMixin, HookDisconnected, Actions, HookStop
+from wpull.application.hook import HookableMixin, Actions, HookStop
 from wpull.pipeline.item import Status, URLRecord
 from wpull.pipeline.session import ItemSession
 import wpull.application.hook
@@ -118,18 +118,19 @@ class FetchRule(HookableMixin):
         Returns:
             tuple: (bool, str)
         '''
-        try:
-            reasons = {
-                'filters': test_info['map'],
-                'reason': reason,
-            }
+        reasons = {
+            'filters': test_info['map'],
+            'reason': reason,
+        }
 
+        if self.hook_dispatcher.is_connected(PluginFunctions.accept_url):
             verdict = self.hook_dispatcher.call(
                 PluginFunctions.accept_url, item_session, verdict, reasons,
             )
             reason = 'callback_hook'
-        except HookDisconnected:
-            pass
+        else:
+            self.event_dispatcher.notify(
+                PluginFunctions.accept_url, item_session, verdict, reasons)
 
         return verdict, reason
 
@@ -375,11 +376,8 @@ class ResultRule(HookableMixin):
     def get_wait_time(self, item_session: ItemSession, error=None):
         '''Return the wait time in seconds between requests.'''
         seconds = self._waiter.get()
-        try:
-            return self.hook_dispatcher.call(PluginFunctions.wait_time, seconds,
-                                             item_session, error)
-        except HookDisconnected:
-            return seconds
+        return self.hook_dispatcher.call_default(
+            PluginFunctions.wait_time, seconds, seconds, item_session, error)
 
     @staticmethod
     @hook_interface(PluginFunctions.wait_time)
@@ -398,13 +396,10 @@ class ResultRule(HookableMixin):
 
     def consult_pre_response_hook(self, item_session: ItemSession) -> Actions:
         '''Return scripting action when a response begins.'''
-        try:
-            return self.hook_dispatcher.call(
-                PluginFunctions.handle_pre_response,
-                item_session
-            )
-        except HookDisconnected:
-            return Actions.NORMAL
+        return self.hook_dispatcher.call_default(
+            PluginFunctions.handle_pre_response, Actions.NORMAL,
+            item_session
+        )
 
     @staticmethod
     @hook_interface(PluginFunctions.handle_pre_response)
@@ -422,12 +417,9 @@ class ResultRule(HookableMixin):
 
     def consult_response_hook(self, item_session: ItemSession) -> Actions:
         '''Return scripting action when a response ends.'''
-        try:
-            return self.hook_dispatcher.call(
-                PluginFunctions.handle_response, item_session
-            )
-        except HookDisconnected:
-            return Actions.NORMAL
+        return self.hook_dispatcher.call_default(
+            PluginFunctions.handle_response, Actions.NORMAL, item_session
+        )
 
     @staticmethod
     @hook_interface(PluginFunctions.handle_response)
@@ -445,11 +437,8 @@ class ResultRule(HookableMixin):
 
     def consult_error_hook(self, item_session: ItemSession, error: BaseException):
         '''Return scripting action when an error occured.'''
-        try:
-            return self.hook_dispatcher.call(
-                PluginFunctions.handle_error, item_session, error)
-        except HookDisconnected:
-            return Actions.NORMAL
+        return self.hook_dispatcher.call_default(
+            PluginFunctions.handle_error, Actions.NORMAL, item_session, error)
 
     @staticmethod
     @hook_interface(PluginFunctions.handle_error)
@@ -557,18 +546,25 @@ class ProcessingRule(HookableMixin):
         num_inline = 0
         num_linked = 0
 
+        parse_url = self.parse_url
+        rewrite_url = self.rewrite_url
+        child_url_record = item_session.child_url_record
+        consult_filters = self._fetch_rule.consult_filters
+        add_child_url = item_session.add_child_url
+        request_url_info = item_session.request.url_info
+
         for link_context in scrape_result.link_contexts:
-            url_info = self.parse_url(link_context.link)
+            url_info = parse_url(link_context.link)
 
             if not url_info:
                 continue
 
-            url_info = self.rewrite_url(url_info)
+            url_info = rewrite_url(url_info)
 
-            child_url_record = item_session.child_url_record(
+            url_record = child_url_record(
                 url_info.url, inline=link_context.inline
             )
-            if not self._fetch_rule.consult_filters(item_session.request.url_info, child_url_record)[0]:
+            if not consult_filters(request_url_info, url_record)[0]:
                 continue
 
             if link_context.inline:
@@ -576,8 +572,8 @@ class ProcessingRule(HookableMixin):
             else:
                 num_linked += 1
 
-            item_session.add_child_url(url_info.url, inline=link_context.inline,
-                                       link_type=link_context.link_type)
+            add_child_url(url_info.url, inline=link_context.inline,
+                          link_type=link_context.link_type)
 
         return num_inline, num_linked
 
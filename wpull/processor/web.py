@@ -340,11 +340,11 @@ class WebProcessorSession(BaseProcessorSession):
         is_redirect = False
 
         if self._strong_redirects:
-            try:
-                is_redirect = self._web_client_session.redirect_tracker\
-                    .is_redirect()
-            except AttributeError:
-                pass
+            redirect_tracker = getattr(
+                self._web_client_session, 'redirect_tracker', None)
+
+            if redirect_tracker is not None:
+                is_redirect = redirect_tracker.is_redirect()
 
         return self._fetch_rule.check_subsequent_web_request(
             self._item_session, is_redirect=is_redirect)
@@ -1,6 +1,5 @@
 '''FTP client.'''
 import enum
-import io
 import logging
 import weakref
 import functools
@@ -45,14 +44,20 @@ class Session(BaseSession):
         transfer_receive_data = 'transfer_receive_data'
         end_transfer = 'end_transfer'
 
-    def __init__(self, login_table: weakref.WeakKeyDictionary, **kwargs):
+    def __init__(self, login_table: weakref.WeakKeyDictionary,
+                 features_table: weakref.WeakKeyDictionary,
+                 stream_table: weakref.WeakKeyDictionary, **kwargs):
         self._login_table = login_table
+        self._features_table = features_table
+        self._stream_table = stream_table
 
         super().__init__(**kwargs)
 
         self._control_connection = None
         self._control_stream = None
         self._commander = None
+        self._control_read_callback = None
+        self._control_write_callback = None
         self._request = None
         self._response = None
         self._data_stream = None
@@ -70,20 +75,51 @@ class Session(BaseSession):
         self.event_dispatcher.register(self.Event.end_transfer)
 
     async def _init_stream(self):
-        '''Create streams and commander.
+        '''Create or reuse streams and commander.
+
+        The control stream and commander are cached per pooled connection
+        so reused connections don't rebuild them on every fetch.
 
         Coroutine.
         '''
         assert not self._control_connection
         self._control_connection = await self._acquire_request_connection(self._request)
-        self._control_stream = ControlStream(self._control_connection)
-        self._commander = Commander(self._control_stream)
 
-        read_callback = functools.partial(self.event_dispatcher.notify, self.Event.control_receive_data)
-        self._control_stream.data_event_dispatcher.add_read_listener(read_callback)
+        cached = self._stream_table.get(self._control_connection)
 
-        write_callback = functools.partial(self.event_dispatcher.notify, self.Event.control_send_data)
-        self._control_stream.data_event_dispatcher.add_write_listener(write_callback)
+        if cached:
+            self._control_stream, self._commander = cached
+        else:
+            self._control_stream = ControlStream(self._control_connection)
+            self._commander = Commander(self._control_stream)
+            self._stream_table[self._control_connection] = \
+                (self._control_stream, self._commander)
+
+        # Forwarding data events is only worthwhile when someone is
+        # listening, so check once here instead of on every chunk.
+        if self.event_dispatcher[self.Event.control_receive_data]:
+            self._control_read_callback = functools.partial(
+                self.event_dispatcher.notify, self.Event.control_receive_data)
+            self._control_stream.data_event_dispatcher.add_read_listener(
+                self._control_read_callback)
+
+        if self.event_dispatcher[self.Event.control_send_data]:
+            self._control_write_callback = functools.partial(
+                self.event_dispatcher.notify, self.Event.control_send_data)
+            self._control_stream.data_event_dispatcher.add_write_listener(
+                self._control_write_callback)
+
+    def _detach_control_listeners(self):
+        '''Remove this session's listeners from the shared control stream.'''
+        if self._control_read_callback:
+            self._control_stream.data_event_dispatcher.remove_read_listener(
+                self._control_read_callback)
+            self._control_read_callback = None
+
+        if self._control_write_callback:
+            self._control_stream.data_event_dispatcher.remove_write_listener(
+                self._control_write_callback)
+            self._control_write_callback = None
 
     async def _log_in(self):
         '''Connect and login.
@@ -166,24 +202,28 @@ class Session(BaseSession):
         response = ListingResponse()
 
         await self._prepare_fetch(request, response)
+
+        has_mlsd = await self._check_mlsd_support()
+
         await self._open_data_stream()
 
-        mlsd_command = Command('MLSD', self._request.file_path)
-        list_command = Command('LIST', self._request.file_path)
+        if has_mlsd:
+            mlsd_command = Command('MLSD', self._request.file_path)
 
-        try:
-            await self._begin_stream(mlsd_command)
-            self._listing_type = 'mlsd'
-        except FTPServerError as error:
-            if error.reply_code in (ReplyCodes.syntax_error_command_unrecognized,
-                                    ReplyCodes.command_not_implemented):
-                self._listing_type = None
-            else:
-                raise
+            try:
+                await self._begin_stream(mlsd_command)
+                self._listing_type = 'mlsd'
+            except FTPServerError as error:
+                if error.reply_code in (ReplyCodes.syntax_error_command_unrecognized,
+                                        ReplyCodes.command_not_implemented):
+                    self._listing_type = None
+                else:
+                    raise
 
         if not self._listing_type:
             # This code not in exception handler to avoid incorrect
             # exception chaining
+            list_command = Command('LIST', self._request.file_path)
             await self._begin_stream(list_command)
             self._listing_type = 'list'
 
@@ -193,6 +233,29 @@ class Session(BaseSession):
 
         return response
 
+    async def _check_mlsd_support(self) -> bool:
+        '''Return whether the server advertises MLSD support.
+
+        The feature listing is probed once per control connection and
+        cached so repeated directory listings don't waste a round trip
+        on servers without MLSD.
+
+        Coroutine.
+        '''
+        features = self._features_table.get(self._control_connection)
+
+        if features is None:
+            try:
+                features = await self._commander.features()
+            except FTPServerError:
+                features = ''
+
+            self._features_table[self._control_connection] = features
+
+        # RFC 3659 servers advertise MLST (implying MLSD); some also
+        # list MLSD explicitly.
+        return 'MLSD' in features or 'MLST' in features
+
     async def _prepare_fetch(self, request: Request, response: Response):
         '''Prepare for a fetch.
 
@@ -207,6 +270,7 @@ class Session(BaseSession):
 
         if connection_closed:
             self._login_table.pop(self._control_connection, None)
+            self._commander.reset()
             await self._control_stream.reconnect()
 
         request.address = self._control_connection.address
@@ -223,7 +287,8 @@ class Session(BaseSession):
 
     async def _begin_stream(self, command: Command):
         '''Start data stream transfer.'''
-        begin_reply = await self._commander.begin_stream(command)
+        begin_reply = await self._commander.begin_stream(
+            command, self._data_stream)
 
         self._response.reply = begin_reply
 
@@ -311,32 +376,28 @@ class Session(BaseSession):
         try:
             if self._response.body.tell() == 0:
                 listings = ()
-            elif self._listing_type == 'mlsd':
-                self._response.body.seek(0)
-
-                machine_listings = wpull.protocol.ftp.util.parse_machine_listing(
-                    self._response.body.read().decode('utf-8',
-                                                      errors='surrogateescape'),
-                    convert=True, strict=False
-                )
-                listings = list(
-                    wpull.protocol.ftp.util.machine_listings_to_file_entries(
-                        machine_listings
-                    ))
             else:
                 self._response.body.seek(0)
 
-                file = io.TextIOWrapper(self._response.body, encoding='utf-8',
-                                        errors='surrogateescape')
+                text = self._response.body.read().decode(
+                    'utf-8', errors='surrogateescape')
 
-                listing_parser = ListingParser(file=file)
+                if self._listing_type == 'mlsd':
+                    machine_listings = \
+                        wpull.protocol.ftp.util.parse_machine_listing(
+                            text, convert=True, strict=False
+                        )
+                    listings = list(
+                        wpull.protocol.ftp.util.machine_listings_to_file_entries(
+                            machine_listings
+                        ))
+                else:
+                    listing_parser = ListingParser(text=text)
 
-                listings = list(listing_parser.parse_input())
+                    listings = list(listing_parser.parse_input())
 
-                _logger.debug('Listing detected as %s', listing_parser.type)
-
-                # We don't want the file to be closed when exiting this function
-                file.detach()
+                    _logger.debug('Listing detected as %s',
+                                  listing_parser.type)
 
         except (ListingError, ValueError) as error:
             raise ProtocolError(*error.args) from error
@@ -356,19 +417,20 @@ class Session(BaseSession):
         '''
         async def connection_factory(address: Tuple[int, int]):
             self._data_connection = await self._acquire_connection(address[0], address[1])
+            self._response.data_address = address
             return self._data_connection
 
         self._data_stream = await self._commander.setup_data_stream(
             connection_factory
         )
 
-        self._response.data_address = self._data_connection.address
-
-        read_callback = functools.partial(self.event_dispatcher.notify, self.Event.transfer_receive_data)
-        self._data_stream.data_event_dispatcher.add_read_listener(read_callback)
+        if self.event_dispatcher[self.Event.transfer_receive_data]:
+            read_callback = functools.partial(self.event_dispatcher.notify, self.Event.transfer_receive_data)
+            self._data_stream.data_event_dispatcher.add_read_listener(read_callback)
 
-        write_callback = functools.partial(self.event_dispatcher.notify, self.Event.transfer_send_data)
-        self._data_stream.data_event_dispatcher.add_write_listener(write_callback)
+        if self.event_dispatcher[self.Event.transfer_send_data]:
+            write_callback = functools.partial(self.event_dispatcher.notify, self.Event.transfer_send_data)
+            self._data_stream.data_event_dispatcher.add_write_listener(write_callback)
 
     async def _fetch_size(self, request: Request) -> int:
         '''Return size of file.
@@ -384,6 +446,7 @@ class Session(BaseSession):
     def abort(self):
         super().abort()
         self._close_data_connection()
+        self._detach_control_listeners()
 
         if self._control_connection:
             self._login_table.pop(self._control_connection, None)
@@ -391,6 +454,7 @@ class Session(BaseSession):
     def recycle(self):
         super().recycle()
         self._close_data_connection()
+        self._detach_control_listeners()
 
         if self._control_connection:
             self.event_dispatcher.notify(
@@ -417,9 +481,15 @@ class Client(BaseClient):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._login_table = weakref.WeakKeyDictionary()
+        self._features_table = weakref.WeakKeyDictionary()
+        self._stream_table = weakref.WeakKeyDictionary()
+        self._session_factory = functools.partial(
+            Session, login_table=self._login_table,
+            features_table=self._features_table,
+            stream_table=self._stream_table)
 
     def _session_class(self) -> Session:
-        return functools.partial(Session, login_table=self._login_table)
+        return self._session_factory
 
     def session(self) -> Session:
         return super().session()
@@ -105,6 +105,28 @@ class TestClient(FTPTestCase):
         self.assertEqual('example (copy).txt', response.files[3].name)
         self.assertEqual('readme.txt', response.files[4].name)
 
+    @gen_test(timeout=30)
+    async def test_fetch_listing_no_mlsd(self):
+        client = Client()
+        file = io.BytesIO()
+
+        with client.session() as session:
+            original_func = session._log_in
+
+            async def override_func():
+                await original_func()
+                await session._control_stream.write_command(Command('EVIL_NO_FEAT'))
+
+            session._log_in = override_func
+
+            response = await \
+                session.start_listing(Request(self.get_url('/')))
+            await session.download_listing(file)
+
+            self.assertEqual('list', session._listing_type)
+
+        self.assertEqual(5, len(response.files))
+
     @gen_test(timeout=30)
     async def test_fetch_bad_pasv_addr(self):
         client = Client()
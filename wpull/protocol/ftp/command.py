@@ -2,7 +2,7 @@
 import logging
 
 from typing import Sequence, Tuple, Callable, IO
-from typing import Union
+from typing import Optional, Union
 
 from wpull.errors import ProtocolError
 from wpull.network.connection import Connection
@@ -24,6 +24,14 @@ class Commander:
     '''
     def __init__(self, data_stream):
         self._control_stream = data_stream
+        self._binary_mode = False
+
+    def reset(self):
+        '''Forget server state remembered for the current connection.
+
+        Call this after the control connection is re-established.
+        '''
+        self._binary_mode = False
 
     @classmethod
     def raise_if_not_match(cls, action: str,
@@ -84,7 +92,22 @@ class Commander:
         self.raise_if_not_match(
             'Login password', ReplyCodes.user_logged_in_proceed, reply)
 
-    
+
+    async def features(self) -> str:
+        '''Return the server feature listing.
+
+        Coroutine.
+        '''
+        await self._control_stream.write_command(Command('FEAT'))
+
+        reply = await self._control_stream.read_reply()
+
+        self.raise_if_not_match(
+            'Features', ReplyCodes.system_status_or_system_help_reply, reply)
+
+        return reply.text
+
+
     async def passive_mode(self) -> Tuple[str, int]:
         '''Enable passive mode.
 
@@ -113,8 +136,10 @@ class Commander:
             DataStream:
         '''Create and setup a data stream.
 
-        This function will set up passive and binary mode and handle
-        connecting to the data connection.
+        This function will set up passive and binary mode and prepare the
+        data connection. The connection itself is established by
+        :meth:`begin_stream` so the TCP handshake overlaps the transfer
+        command round trip.
 
         Args:
             connection_factory: A coroutine callback that returns a connection
@@ -125,10 +150,14 @@ class Commander:
         Returns:
             DataStream
         '''
-        await self._control_stream.write_command(Command('TYPE', 'I'))
-        reply = await self._control_stream.read_reply()
+        if not self._binary_mode:
+            await self._control_stream.write_command(Command('TYPE', 'I'))
+            reply = await self._control_stream.read_reply()
+
+            self.raise_if_not_match(
+                'Binary mode', ReplyCodes.command_okay, reply)
 
-        self.raise_if_not_match('Binary mode', ReplyCodes.command_okay, reply)
+            self._binary_mode = True
 
         address = await self.passive_mode()
 
@@ -138,19 +167,20 @@ class Commander:
         # the same port over time but within pool cleaning intervals
         connection.reset()
 
-        await connection.connect()
-
         data_stream = data_stream_factory(connection)
 
         return data_stream
 
-    
-    async def begin_stream(self, command: Command) -> Reply:
+
+    async def begin_stream(self, command: Command,
+                           data_stream: Optional[DataStream]=None) -> Reply:
         '''Start sending content on the data stream.
 
         Args:
             command: A command that tells the server to send data over the
             data connection.
+            data_stream: The data stream to connect while the server
+            processes the command.
 
         Coroutine.
 
@@ -158,6 +188,10 @@ class Commander:
             The begin reply.
         '''
         await self._control_stream.write_command(command)
+
+        if data_stream:
+            await data_stream.connect()
+
         reply = await self._control_stream.read_reply()
 
         self.raise_if_not_match(
@@ -159,6 +159,10 @@ class LineParser:
                             symlink_dest, perm=perms)
 
 
+UNIX_PERM_PATTERN = re.compile(r'---|r--|rw-|rwx')
+MSDOS_DATE_PATTERN = re.compile(r'^.{0,4}\d\d')
+
+
 def guess_listing_type(lines, threshold=100):
     '''Guess the style of directory listing.
 
@@ -174,10 +178,10 @@ def guess_listing_type(lines, threshold=100):
         if not line:
             continue
 
-        if re.search(r'---|r--|rw-|rwx', line):
+        if UNIX_PERM_PATTERN.search(line):
             scores['unix'] += 1
 
-        if '<DIR>' in line or re.search(r'^.{0,4}\d\d', line):
+        if '<DIR>' in line or MSDOS_DATE_PATTERN.search(line):
             scores['msdos'] += 1
 
         words = line.split(' ', 1)
@@ -250,21 +254,16 @@ class ListingParser(LineParser):
         '''
 
         if self._text:
-            lines = iter(self._text.splitlines())
+            # The line list is already in memory; sample it by slicing
+            # instead of copying lines into a second buffer.
+            lines = self._text.splitlines()
+            sample_lines = lines[:100]
         elif self._file:
-            lines = self._file
+            lines = iter(self._file)
+            sample_lines = list(itertools.islice(lines, 101))
+            lines = itertools.chain(sample_lines, lines)
         else:
-            lines = ()
-
-        sample_lines = []
-
-        for line in lines:
-            if len(sample_lines) > 100:
-                break
-
-            sample_lines.append(line)
-
-        lines = itertools.chain(sample_lines, lines)
+            lines = sample_lines = ()
 
         self.guess_type(sample_lines)
 
@@ -8,6 +8,10 @@ from wpull.errors import ProtocolError
 import wpull.protocol.ftp.util
 
 
+COMMAND_PATTERN = re.compile(br'(\w+) ?([^\r\n]*)')
+REPLY_LINE_PATTERN = re.compile(br'(\d{3}|^)([ -]?)(.*)')
+
+
 class Command(SerializableMixin, DictableMixin):
     '''FTP request command.
 
@@ -37,7 +41,7 @@ class Command(SerializableMixin, DictableMixin):
         assert self.name is None
         assert not self.argument
 
-        match = re.match(br'(\w+) ?([^\r\n]*)', data)
+        match = COMMAND_PATTERN.match(data)
 
         if not match:
             raise ProtocolError('Failed to parse command.')
@@ -71,7 +75,7 @@ class Reply(SerializableMixin, DictableMixin):
 
     def parse(self, data):
         for line in data.splitlines(False):
-            match = re.match(br'(\d{3}|^)([ -]?)(.*)', line)
+            match = REPLY_LINE_PATTERN.match(line)
 
             if not match:
                 raise ProtocolError('Failed to parse reply.')
@@ -38,7 +38,16 @@ class DataStream:
         '''Return whether the connection is closed.'''
         return self._connection.closed()
 
-    
+
+    async def connect(self):
+        '''Connect the data connection if not already connected.
+
+        Coroutine.
+        '''
+        if self._connection.closed():
+            await self._connection.connect()
+
+
     @close_stream_on_error
     async def read_file(self, file: Union[IO, asyncio.StreamWriter]=None):
         '''Read from connection to file.
@@ -49,8 +58,10 @@ class DataStream:
         if file:
             file_is_async = hasattr(file, 'drain')
 
+        notify_read = self._data_event_dispatcher.notify_read
+
         while True:
-            data = await self._connection.read(4096)
+            data = await self._connection.read(65536)
 
             if not data:
                 break
@@ -61,7 +72,7 @@ class DataStream:
                 if file_is_async:
                     await file.drain()
 
-            self._data_event_dispatcher.notify_read(data)
+            notify_read(data)
 
     # TODO: def write_file()
 
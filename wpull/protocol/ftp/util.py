@@ -57,18 +57,20 @@ class FTPServerError(ServerError):
             return self.args[1]
 
 
+PASV_ADDRESS_PATTERN = re.compile(
+    r'\('
+    r'(\d{1,3})\s*,'
+    r'\s*(\d{1,3})\s*,'
+    r'\s*(\d{1,3})\s*,'
+    r'\s*(\d{1,3})\s*,'
+    r'\s*(\d{1,3})\s*,'
+    r'\s*(\d{1,3})\s*'
+    r'\)')
+
+
 def parse_address(text: str) -> Tuple[str, int]:
     '''Parse PASV address.'''
-    match = re.search(
-        r'\('
-        r'(\d{1,3})\s*,'
-        r'\s*(\d{1,3})\s*,'
-        r'\s*(\d{1,3})\s*,'
-        r'\s*(\d{1,3})\s*,'
-        r'\s*(\d{1,3})\s*,'
-        r'\s*(\d{1,3})\s*'
-        r'\)',
-        text)
+    match = PASV_ADDRESS_PATTERN.search(text)
 
     if match:
         return (
@@ -156,10 +158,10 @@ def convert_machine_list_value(name: str, value: str) -> \
 
     Size will be ``int`` while time value will be :class:`datetime.datetime`.
     '''
-    if name == 'modify':
-        return convert_machine_list_time_val(value)
-    elif name == 'size':
-        return int(value)
+    converter = MACHINE_LIST_CONVERTERS.get(name)
+
+    if converter:
+        return converter(value)
     else:
         return value
 
@@ -183,6 +185,12 @@ def convert_machine_list_time_val(text: str) -> datetime.datetime:
                              tzinfo=datetime.timezone.utc)
 
 
+MACHINE_LIST_CONVERTERS = {
+    'modify': convert_machine_list_time_val,
+    'size': int,
+}
+
+
 def machine_listings_to_file_entries(listings: Iterable[dict]) -> \
         Iterable[FileEntry]:
     '''Convert results from parsing machine listings to FileEntry list.'''
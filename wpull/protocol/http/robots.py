@@ -12,7 +12,6 @@ from wpull.protocol.http.request import Request, Response
 from wpull.protocol.http.web import WebClient
 from wpull.robotstxt import RobotsTxtPool
 from wpull.url import URLInfo
-import wpull.util
 
 
 _logger = logging.getLogger(__name__)
@@ -73,7 +72,8 @@ class RobotsTxtChecker:
 
             session = self._web_client.session(request)
             while not session.done():
-                wpull.util.truncate_file(file.name)
+                file.seek(0)
+                file.truncate()
 
                 try:
                     response = await session.start()
@@ -176,7 +176,7 @@ class WebSession:
 
         self._next_request = request
 
-        _logger.debug('Updated next redirect request to {0}.'.format(request))
+        _logger.debug('Updated next redirect request to %s.', request)
 
     def _get_cookie_referrer_host(self):
         '''Return the referrer hostname.'''
@@ -126,8 +126,10 @@ class FTPSession:
                 'REST': self._cmd_rest,
                 'CWD': self._cmd_cwd,
                 'TYPE': self._cmd_type,
+                'FEAT': self._cmd_feat,
                 'PWD': self._cmd_pwd,
                 'EVIL_BAD_PASV_ADDR': self._cmd_evil_bad_pasv_addr,
+                'EVIL_NO_FEAT': self._cmd_evil_no_feat,
             }
             func = funcs.get(self.command)
 
@@ -322,12 +324,21 @@ class FTPSession:
         else:
             self.writer.write(b'500 Unknown type\r\n')
 
+    async def _cmd_feat(self):
+        if 'no_feat' in self.evil_flags:
+            self.writer.write(b'500 What?\r\n')
+        else:
+            self.writer.write(b'211-Features:\r\n MLSD\r\n211 End\r\n')
+
     async def _cmd_pwd(self):
         self.writer.write(b'257 /\r\n')
 
     async def _cmd_evil_bad_pasv_addr(self):
         self.evil_flags.add('bad_pasv_addr')
 
+    async def _cmd_evil_no_feat(self):
+        self.evil_flags.add('no_feat')
+
 
 class FTPTestCase(AsyncTestCase):
     def server_port(self):